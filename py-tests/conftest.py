@@ -0,0 +1,20 @@
+"""Shared pytest fixtures for wrapex tests."""
+
+import pytest
+import wrapex
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _prefetch():
+    """Warm wrapex's listing and content caches once for the whole session."""
+    for list_names, get in [
+        (wrapex.list_skills, wrapex.get_skill),
+        (wrapex.list_rules, wrapex.get_rule),
+        (wrapex.list_examples, wrapex.get_example),
+        (wrapex.list_templates, wrapex.get_template),
+        (wrapex.list_schemas_ts, wrapex.get_schema_ts),
+        (wrapex.list_src, wrapex.get_src),
+    ]:
+        for name in list_names():
+            get(name)
+    wrapex.get_skill_md()
@@ -11,7 +11,7 @@ class TestListSkills:
 
     def test_skills_are_sorted(self):
         skills = wrapex.list_skills()
-        assert skills == sorted(skills)
+        assert list(skills) == sorted(skills)
 
     def test_first_skill_is_diagnose(self):
         skills = wrapex.list_skills()
@@ -36,6 +36,14 @@ class TestGetSkill:
         with pytest.raises(FileNotFoundError):
             wrapex.get_skill("99-nonexistent")
 
+    def test_missing_subpath_lists_available(self):
+        with pytest.raises(FileNotFoundError, match="'x/y' in skills/.*01-diagnose.md"):
+            wrapex.get_skill("x/y")
+
+    def test_ambiguous_prefix_raises(self):
+        with pytest.raises(FileNotFoundError, match="Ambiguous"):
+            wrapex.get_skill("1")
+
 
 class TestListRules:
     def test_returns_at_least_one_rule(self):
@@ -80,10 +88,37 @@ class TestGetExample:
         content = wrapex.get_example("zustand")
         assert len(content) > 0
 
+    def test_trailing_separator(self):
+        content = wrapex.get_example("zustand-store-wrap/")
+        assert len(content) > 0
+
     def test_missing_raises(self):
         with pytest.raises(FileNotFoundError):
             wrapex.get_example("nonexistent-example")
 
+    def test_missing_readme_raises(self, tmp_path, monkeypatch):
+        from wrapex import _data
+        from wrapex._paths import _readme
+
+        assert _readme(tmp_path) is None
+        monkeypatch.setitem(_data.EXAMPLES, "no-readme-wrap", tmp_path)
+        with pytest.raises(FileNotFoundError, match="No README.md"):
+            wrapex.get_example("no-readme-wrap")
+
+    def test_readme_directory_is_not_a_readme(self, tmp_path):
+        from wrapex._paths import _readme
+
+        (tmp_path / "README.md").mkdir()
+        assert _readme(tmp_path) is None
+
+    def test_readme_is_read_once(self):
+        from wrapex._data import _read_cached
+
+        wrapex.get_example("zustand")
+        misses = _read_cached.cache_info().misses
+        wrapex.get_example("zustand")
+        assert _read_cached.cache_info().misses == misses
+
 
 class TestListTemplates:
     def test_returns_at_least_one(self):
@@ -105,6 +140,14 @@ class TestListSchemas:
         assert len(names) >= 3
 
 
+class TestListZodSchemas:
+    def test_returns_only_schema_files(self):
+        schemas = wrapex.list_zod_schemas()
+        assert len(schemas) >= 3
+        assert all(s.endswith(".schema.ts") for s in schemas)
+        assert "index.ts" not in schemas
+
+
 class TestGetSchemaTs:
     def test_command_candidate(self):
         content = wrapex.get_schema_ts("command-candidate")
@@ -127,9 +170,54 @@ class TestGetSrc:
         content = wrapex.get_src("define-command")
         assert "defineCommand" in content
 
+    def test_subpath(self):
+        content = wrapex.get_src("schemas/index.ts")
+        assert len(content) > 0
+
+    def test_subpath_prefix(self):
+        content = wrapex.get_src("schemas/command")
+        assert "CommandCandidate" in content
+
 
 class TestGetSkillMd:
     def test_returns_content(self):
         content = wrapex.get_skill_md()
         assert len(content) > 0
         assert "SKILL" in content.upper() or "wrapex" in content.lower()
+
+    def test_read_once(self):
+        assert wrapex.get_skill_md() is wrapex.get_skill_md()
+
+
+class TestListingCache:
+    def test_listing_is_shared_immutable_tuple(self):
+        skills = wrapex.list_skills()
+        assert isinstance(skills, tuple)
+        assert wrapex.list_skills() is skills
+
+    def test_clear_caches(self):
+        from wrapex._data import _clear_caches, _list_files, _read_cached
+
+        before = wrapex.list_rules()
+        wrapex.get_rule(before[0])
+        _clear_caches()
+        assert _list_files.cache_info().currsize == 0
+        assert _read_cached.cache_info().currsize == 0
+        assert wrapex.list_rules() == before
+
+    def test_prefix_and_exact_share_cached_content(self):
+        assert wrapex.get_skill("01") is wrapex.get_skill("01-diagnose.md")
+
+
+class TestReader:
+    def test_fast_read_returns_raw_bytes(self, tmp_path):
+        from wrapex._data import _fast_read
+
+        path = tmp_path / "crlf.md"
+        path.write_bytes(b"# a\r\nb\rc\n")
+        assert _fast_read(path) == b"# a\r\nb\rc\n"
+
+    def test_decode_normalises_newlines(self):
+        from wrapex._data import _decode
+
+        assert _decode(b"# a\r\nb\rc\n") == "# a\nb\nc\n"
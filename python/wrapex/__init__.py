@@ -33,6 +33,7 @@ from wrapex._data import (
     list_examples,
     list_templates,
     list_schemas_ts,
+    list_zod_schemas,
     list_src,
 )
 
@@ -49,5 +50,6 @@ __all__ = [
     "list_examples",
     "list_templates",
     "list_schemas_ts",
+    "list_zod_schemas",
     "list_src",
 ]
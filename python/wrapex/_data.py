@@ -1,7 +1,10 @@
 """Data access API for wrapex bundled content."""
 
+import os
+from bisect import bisect_left
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Tuple
 
 from wrapex._paths import (
     SKILLS_DIR,
@@ -9,110 +12,197 @@ from wrapex._paths import (
     EXAMPLES_DIR,
     TEMPLATES_DIR,
     SRC_DIR,
+    SCHEMAS_DIR,
     SKILL_MD,
+    EXAMPLES,
+    EXAMPLE_READMES,
+    INDEX,
+    NAMES,
+    DIR_INDEX,
+    Traversable,
+    _index,
 )
 
 
-def _resolve(directory: Path, name: str, suffix: str = ".md") -> Path:
-    """Resolve a file by exact name or prefix match."""
-    # Try exact match first
-    exact = directory / name
-    if exact.is_file():
-        return exact
+def _prefix_matches(names: Tuple[str, ...], prefix: str) -> List[str]:
+    """Return the names starting with ``prefix``, given sorted ``names``.
 
-    # Try with suffix
-    with_suffix = directory / (name + suffix)
-    if with_suffix.is_file():
-        return with_suffix
+    Matches form a contiguous run, found by bisection in O(log N + k).
+    """
+    n, nl = len(names), len(prefix)
+    lo = hi = bisect_left(names, prefix)
+    while hi < n and names[hi][:nl] == prefix:
+        hi += 1
+    return list(names[lo:hi])
+
+
+def _resolve(directory: Traversable, name: str, suffix: str = ".md") -> Traversable:
+    """Resolve a file by exact name or prefix match.
+
+    Looks names up in the import-time index, so no filesystem calls are made
+    for bundled directories.
+    """
+    # Names with subpaths (e.g. 'schemas/command') resolve in the subdirectory
+    parent, sep, base = name.replace(os.sep, "/").rpartition("/")
+    search_dir = directory / parent if sep else directory
+    key = str(search_dir)
+    files = _files(search_dir)
+
+    # Try exact match first, then with suffix
+    path = files.get(base) or files.get(base + suffix)
+    if path is not None:
+        return path
 
     # Try prefix match
-    candidates = sorted(directory.glob(f"{name}*"))
-    files = [c for c in candidates if c.is_file()]
-    if len(files) == 1:
-        return files[0]
-    if len(files) > 1:
-        names = [f.name for f in files]
+    names = NAMES.get(key) or tuple(files)
+    candidates = _prefix_matches(names, base)
+    if len(candidates) == 1:
+        return files[candidates[0]]
+    if len(candidates) > 1:
+        matches = [parent + sep + c for c in candidates]
         raise FileNotFoundError(
-            f"Ambiguous prefix '{name}' in {directory.name}/: matches {names}"
+            f"Ambiguous prefix '{name}' in {directory.name}/: matches {matches}"
         )
 
     raise FileNotFoundError(
         f"No file matching '{name}' in {directory.name}/. "
-        f"Available: {[f.name for f in sorted(directory.iterdir()) if f.is_file()]}"
+        f"Available: {list(_files(directory))}"
     )
 
 
-def _list_files(directory: Path, suffix: str = "") -> List[str]:
-    """List file names in a directory, optionally filtering by suffix."""
-    if not directory.is_dir():
-        return []
-    files = sorted(directory.iterdir())
+def _files(directory: Traversable) -> Dict[str, Traversable]:
+    """Map file names in a directory to paths.
+
+    Bundled directories come from the import-time index; anything else is
+    scanned on each call rather than cached, since callers choose the path.
+    """
+    files = INDEX.get(str(directory))
+    return _index(directory) if files is None else files
+
+
+@lru_cache(maxsize=None)
+def _list_files(directory: Traversable, suffix: str = "") -> Tuple[str, ...]:
+    """List file names in a directory, optionally filtering by suffix.
+
+    Bundled data is immutable at runtime, so listings are cached per
+    ``(directory, suffix)``.
+    """
+    files = _files(directory)
     if suffix:
-        return [f.name for f in files if f.is_file() and f.suffix == suffix]
-    return [f.name for f in files if f.is_file()]
+        return tuple(f for f in files if f.endswith(suffix))
+    return tuple(files)
+
+
+@lru_cache(maxsize=None)
+def _list_dirs(directory: Traversable) -> Tuple[str, ...]:
+    """List subdirectory names in a directory (cached, like ``_list_files``)."""
+    dirs = DIR_INDEX.get(str(directory))
+    if dirs is None:
+        dirs = _index(directory, dirs=True)
+    return tuple(dirs)
+
+
+def _decode(data: bytes) -> str:
+    """Decode UTF-8 bytes with universal newlines, as ``read_text`` would."""
+    return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
 
 
-def _list_dirs(directory: Path) -> List[str]:
-    """List subdirectory names in a directory."""
-    if not directory.is_dir():
-        return []
-    return sorted(d.name for d in directory.iterdir() if d.is_dir())
+def _fast_read(path: Path) -> bytes:
+    """Read a small file with raw os calls, skipping io's wrapper layers."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        chunks = []
+        size = max(os.fstat(fd).st_size, 1)
+        while True:
+            chunk = os.read(fd, size)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=None)
+def _read_cached(path: Traversable) -> str:
+    """Read a bundled file as UTF-8, cached per resolved path.
+
+    The bundle is small and fixed, so the cache is unbounded: each file is
+    read from disk at most once per process.
+    """
+    if isinstance(path, Path):  # Regular install: real filesystem
+        return _decode(_fast_read(path))
+    # Other Traversables, e.g. zipfile.Path when imported from a zip
+    return _decode(path.read_bytes())
+
+
+def _clear_caches() -> None:
+    """Clear cached listings and file contents (for tests).
+
+    Bundled directories stay in the import-time index, so this does not
+    force them to be rescanned.
+    """
+    _list_files.cache_clear()
+    _list_dirs.cache_clear()
+    _read_cached.cache_clear()
 
 
 # ── Skills ──────────────────────────────────────────────────────────────────
 
 
-def list_skills() -> List[str]:
+def list_skills() -> Tuple[str, ...]:
     """List available skill file names."""
     return _list_files(SKILLS_DIR, suffix=".md")
 
 
 def get_skill(name: str) -> str:
     """Get a skill file's content by name or prefix (e.g., '01' or '01-diagnose')."""
-    return _resolve(SKILLS_DIR, name).read_text(encoding="utf-8")
+    return _read_cached(_resolve(SKILLS_DIR, name))
 
 
 # ── Rules ───────────────────────────────────────────────────────────────────
 
 
-def list_rules() -> List[str]:
+def list_rules() -> Tuple[str, ...]:
     """List available rule file names."""
     return _list_files(RULES_DIR, suffix=".md")
 
 
 def get_rule(name: str) -> str:
     """Get a rule file's content by name or prefix."""
-    return _resolve(RULES_DIR, name).read_text(encoding="utf-8")
+    return _read_cached(_resolve(RULES_DIR, name))
 
 
 # ── Examples ────────────────────────────────────────────────────────────────
 
 
-def list_examples() -> List[str]:
+def list_examples() -> Tuple[str, ...]:
     """List available example directory names."""
     return _list_dirs(EXAMPLES_DIR)
 
 
+def _read_readme(name: str) -> str:
+    """Read an example's README.md, raising FileNotFoundError if it is missing."""
+    readme = EXAMPLE_READMES.get(name)
+    if readme is None:
+        raise FileNotFoundError(f"No README.md in examples/{name}/")
+    return _read_cached(readme)
+
+
 def get_example(name: str) -> str:
     """Get an example's README.md content by directory name or prefix."""
+    name = name.rstrip("/" + os.sep)
+
     # Resolve directory
-    exact = EXAMPLES_DIR / name
-    if exact.is_dir():
-        readme = exact / "README.md"
-        if readme.is_file():
-            return readme.read_text(encoding="utf-8")
-        raise FileNotFoundError(f"No README.md in examples/{name}/")
+    if name in EXAMPLES:
+        return _read_readme(name)
 
     # Prefix match on directories
-    candidates = sorted(d for d in EXAMPLES_DIR.iterdir() if d.is_dir() and d.name.startswith(name))
+    candidates = _prefix_matches(_list_dirs(EXAMPLES_DIR), name)
     if len(candidates) == 1:
-        readme = candidates[0] / "README.md"
-        if readme.is_file():
-            return readme.read_text(encoding="utf-8")
-        raise FileNotFoundError(f"No README.md in examples/{candidates[0].name}/")
+        return _read_readme(candidates[0])
     if len(candidates) > 1:
         raise FileNotFoundError(
-            f"Ambiguous prefix '{name}' in examples/: matches {[d.name for d in candidates]}"
+            f"Ambiguous prefix '{name}' in examples/: matches {candidates}"
         )
     raise FileNotFoundError(
         f"No example matching '{name}'. Available: {list_examples()}"
@@ -122,42 +212,45 @@ def get_example(name: str) -> str:
 # ── Templates ───────────────────────────────────────────────────────────────
 
 
-def list_templates() -> List[str]:
+def list_templates() -> Tuple[str, ...]:
     """List available template file names."""
     return _list_files(TEMPLATES_DIR)
 
 
 def get_template(name: str) -> str:
     """Get a template file's content by name or prefix."""
-    return _resolve(TEMPLATES_DIR, name, suffix=".ts.template").read_text(encoding="utf-8")
+    return _read_cached(_resolve(TEMPLATES_DIR, name, suffix=".ts.template"))
 
 
 # ── TypeScript Schemas ──────────────────────────────────────────────────────
 
 
-def list_schemas_ts() -> List[str]:
+def list_schemas_ts() -> Tuple[str, ...]:
     """List available TypeScript schema file names from src/schemas/."""
-    schemas_dir = SRC_DIR / "schemas"
-    return _list_files(schemas_dir, suffix=".ts")
+    return _list_files(SCHEMAS_DIR, suffix=".ts")
+
+
+def list_zod_schemas() -> Tuple[str, ...]:
+    """List Zod schema file names (``*.schema.ts``) from src/schemas/."""
+    return _list_files(SCHEMAS_DIR, suffix=".schema.ts")
 
 
 def get_schema_ts(name: str) -> str:
     """Get a TypeScript schema file's content by name or prefix."""
-    schemas_dir = SRC_DIR / "schemas"
-    return _resolve(schemas_dir, name, suffix=".ts").read_text(encoding="utf-8")
+    return _read_cached(_resolve(SCHEMAS_DIR, name, suffix=".ts"))
 
 
 # ── TypeScript Source ───────────────────────────────────────────────────────
 
 
-def list_src() -> List[str]:
+def list_src() -> Tuple[str, ...]:
     """List TypeScript source files in src/."""
     return _list_files(SRC_DIR, suffix=".ts")
 
 
 def get_src(name: str) -> str:
     """Get a TypeScript source file's content by name or prefix."""
-    return _resolve(SRC_DIR, name, suffix=".ts").read_text(encoding="utf-8")
+    return _read_cached(_resolve(SRC_DIR, name, suffix=".ts"))
 
 
 # ── SKILL.md ────────────────────────────────────────────────────────────────
@@ -165,4 +258,4 @@ def get_src(name: str) -> str:
 
 def get_skill_md() -> str:
     """Get the master SKILL.md content."""
-    return SKILL_MD.read_text(encoding="utf-8")
+    return _read_cached(SKILL_MD)
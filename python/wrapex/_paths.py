@@ -1,12 +1,96 @@
 """Path resolution for wrapex bundled data."""
 
+import os
+import sys
+from importlib.resources import files
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 
-_DATA_DIR = Path(__file__).parent / "data"
+try:
+    from importlib.resources.abc import Traversable
+except ImportError:  # Python < 3.11
+    from importlib.abc import Traversable
+
+# Resolved through importlib.resources so the data is reachable even when the
+# package is not installed unpacked (e.g. imported from a zip).
+_DATA_DIR = files("wrapex") / "data"
 
 SKILLS_DIR = _DATA_DIR / "skills"
 RULES_DIR = _DATA_DIR / "rules"
 EXAMPLES_DIR = _DATA_DIR / "examples"
 TEMPLATES_DIR = _DATA_DIR / "templates"
 SRC_DIR = _DATA_DIR / "src"
+SCHEMAS_DIR = SRC_DIR / "schemas"
 SKILL_MD = _DATA_DIR / "SKILL.md"
+
+
+def _index(directory: Traversable, dirs: bool = False) -> Dict[str, Traversable]:
+    """Map entry names in a directory to their paths, sorted by name.
+
+    Collects files (or subdirectories, if ``dirs``) in a single scandir pass.
+    Names are interned, since every listing hands out these same strings.
+    Returns an empty dict if the directory does not exist.
+    """
+    if not directory.is_dir():
+        return {}
+    if isinstance(directory, Path):  # Regular install: real filesystem
+        with os.scandir(directory) as it:
+            entries = list(it)
+    else:  # Non-filesystem Traversable (e.g. zipfile.Path)
+        entries = list(directory.iterdir())
+    names = sorted(e.name for e in entries if (e.is_dir() if dirs else e.is_file()))
+    return {sys.intern(n): directory / n for n in names}
+
+
+def _index_tree(directory: Traversable) -> Dict[str, Dict[str, Traversable]]:
+    """Index ``directory`` and every subdirectory below it, keyed by ``str(path)``.
+
+    String keys let subpath lookups (e.g. ``src/schemas``) find their entry
+    even when the joined path is a fresh, non-hashable-equal Traversable.
+    """
+    index = {str(directory): _index(directory)}
+    for sub in _index(directory, dirs=True).values():
+        index.update(_index_tree(sub))
+    return index
+
+
+def _readme(example_dir: Traversable) -> Optional[Traversable]:
+    """Return an example's README.md if it is a file, else None.
+
+    On a real filesystem this is one scandir pass; the entry type comes from
+    the directory entry, so no separate stat is needed.
+    """
+    readme = example_dir / "README.md"
+    if isinstance(example_dir, Path):  # Regular install: real filesystem
+        with os.scandir(example_dir) as it:
+            found = any(e.name == "README.md" and e.is_file() for e in it)
+    else:
+        found = readme.is_file()
+    return readme if found else None
+
+
+# Bundled data is fixed at install time, so each directory is scanned once.
+INDEX: Dict[str, Dict[str, Traversable]] = {}
+for _dir in (SKILLS_DIR, RULES_DIR, TEMPLATES_DIR, SRC_DIR):
+    INDEX.update(_index_tree(_dir))
+
+# Sorted name tuples per indexed directory, for prefix bisection
+NAMES: Dict[str, Tuple[str, ...]] = {k: tuple(v) for k, v in INDEX.items()}
+
+SKILLS = INDEX[str(SKILLS_DIR)]
+RULES = INDEX[str(RULES_DIR)]
+TEMPLATES = INDEX[str(TEMPLATES_DIR)]
+SRC = INDEX[str(SRC_DIR)]
+SCHEMAS = INDEX.get(str(SCHEMAS_DIR), {})
+EXAMPLES = _index(EXAMPLES_DIR, dirs=True)
+# README paths are built once, so every read hits the same cache key (zip
+# Traversables have no value-based hashing).
+EXAMPLE_READMES: Dict[str, Traversable] = {}
+for _name, _example_dir in EXAMPLES.items():
+    _readme_path = _readme(_example_dir)
+    if _readme_path is not None:
+        EXAMPLE_READMES[_name] = _readme_path
+
+DIR_INDEX: Dict[str, Dict[str, Traversable]] = {
+    str(EXAMPLES_DIR): EXAMPLES,
+}